@@ -8,19 +8,25 @@ VMs are automatically distributed across multiple namespaces for realistic multi
 """
 
 import argparse
+import asyncio
+import itertools
+import json
 import random
-import string
 import sys
+import threading
 import time
 import warnings
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 # Show InsecureRequestWarning only once
 warnings.filterwarnings('once', message='Unverified HTTPS request')
 
 try:
     from kubernetes import client, config
+    from kubernetes.client import rest
     from kubernetes.client.rest import ApiException
 except ImportError:
     print("Error: kubernetes Python client is required. Install with: pip install kubernetes")
@@ -32,6 +38,19 @@ except ImportError:
     print("Error: tqdm is required for progress bars. Install with: pip install tqdm")
     sys.exit(1)
 
+# orjson is optional, the standard library json module is used without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# kubernetes_asyncio is optional, it is only needed for --async
+try:
+    from kubernetes_asyncio import client as async_client, config as async_config
+    from kubernetes_asyncio.client import rest as async_rest
+except ImportError:
+    async_client = None
+
 
 # Configuration
 DEFAULT_VM_COUNT = 500
@@ -41,8 +60,17 @@ VM_LABEL_KEY = "cnv-scale-test"
 VM_LABEL_VALUE = "synthetic-workload"
 NAMESPACE_LABEL_KEY = "cnv-scale-test"
 NAMESPACE_LABEL_VALUE = "synthetic-workload"
+VM_LABEL_SELECTOR = f"{VM_LABEL_KEY}={VM_LABEL_VALUE}"
+NAMESPACE_LABEL_SELECTOR = f"{NAMESPACE_LABEL_KEY}={NAMESPACE_LABEL_VALUE}"
 VM_PREFIX = "qe-virt"
 NAMESPACE_PREFIX = "qe-ns"
+VM_GROUP = "kubevirt.io"
+VM_VERSION = "v1"
+VM_PLURAL = "virtualmachines"
+VM_API_VERSION = f"{VM_GROUP}/{VM_VERSION}"
+FIELD_MANAGER = "cnv-scale-vms"  # Field manager for server-side apply
+# Ask for list items as metadata only, falling back to full objects
+PARTIAL_METADATA_LIST_ACCEPT = "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1, application/json"
 
 # Randomization ranges
 CPU_RANGE = (1, 4)  # cores
@@ -50,10 +78,55 @@ MEMORY_RANGE = (1, 8)  # GiB
 DISK_RANGE = (10, 50)  # GiB
 VMS_PER_NAMESPACE_RANGE = (1, 20)  # VMs per namespace
 
+# Concurrency
+DEFAULT_WORKERS = 16  # Parallel API requests for VM creation/deletion
+CONNECTION_POOL_MAXSIZE = 64  # HTTPS connections kept open to the API server
+DEFAULT_QPS = 0  # Client-side request rate limit (0 = unlimited)
+DEFAULT_BURST = 100  # Requests allowed above the QPS limit in a burst
+LIST_PAGE_SIZE = 500  # VMs fetched per list request
+
+# Retries of throttled or failed VM requests
+MAX_REQUEST_ATTEMPTS = 5  # Attempts per VM create/apply/delete request
+RETRY_STATUSES = (429, 500, 503, 504)  # HTTP statuses worth retrying
+MAYBE_PERSISTED_STATUSES = (500, 504)  # Retried statuses returned after a write may have been persisted
+MAX_RETRY_BACKOFF = 8  # Upper bound of any wait between attempts, in seconds
+
+# Progress bar redraw throttling
+PROGRESS_MININTERVAL = 0.25  # seconds between redraws
+PROGRESS_MINITERS = 16  # updates between redraw checks
+
+# Failure reporting
+MAX_FAILURE_SAMPLES = 10  # Failed VMs listed individually in the summary
+
+# Static parts of the VM manifest, shared by every generated manifest.
+# The kubernetes client only reads request bodies, so these must never be mutated.
+VM_DISK_DEVICES = {
+    "disks": [
+        {
+            "name": "containerdisk",
+            "disk": {
+                "bus": "virtio"
+            }
+        },
+        {
+            "name": "emptydisk",
+            "disk": {
+                "bus": "virtio"
+            }
+        }
+    ]
+}
+VM_CONTAINERDISK_VOLUME = {
+    "name": "containerdisk",
+    "containerDisk": {
+        "image": "quay.io/kubevirt/cirros-container-disk-demo"
+    }
+}
+
 
 def generate_random_suffix(length: int = 5) -> str:
-    """Generate a random alphanumeric suffix."""
-    return ''.join(random.choices(string.ascii_lowercase + string.digits, k=length))
+    """Generate a random lowercase hex suffix."""
+    return f"{random.getrandbits(4 * length):0{length}x}"
 
 
 def generate_namespace_name(index: int) -> str:
@@ -67,57 +140,304 @@ def generate_vm_name(index: int) -> str:
     return f"{VM_PREFIX}-{index:03d}-{suffix}"
 
 
-def generate_random_specs() -> Dict[str, any]:
-    """Generate random CPU, memory, and disk specifications."""
-    cpu_cores = random.randint(*CPU_RANGE)
-    memory_gi = random.randint(*MEMORY_RANGE)
-    disk_gi = random.randint(*DISK_RANGE)
+def generate_random_specs(count: int) -> List[Dict[str, any]]:
+    """Generate random CPU, memory, and disk specifications for count VMs."""
+    cpu_cores = random.choices(range(CPU_RANGE[0], CPU_RANGE[1] + 1), k=count)
+    memory_gi = random.choices(range(MEMORY_RANGE[0], MEMORY_RANGE[1] + 1), k=count)
+    disk_gi = random.choices(range(DISK_RANGE[0], DISK_RANGE[1] + 1), k=count)
 
-    return {
-        "cpu": cpu_cores,
-        "memory": f"{memory_gi}Gi",
-        "disk": f"{disk_gi}Gi"
-    }
+    return [
+        {
+            "cpu": cpu,
+            "memory": f"{memory}Gi",
+            "disk": f"{disk}Gi",
+            "memory_gi": memory,
+            "disk_gi": disk
+        }
+        for cpu, memory, disk in zip(cpu_cores, memory_gi, disk_gi)
+    ]
+
+
+def plan_distribution(count: int, start_index: int = 1) -> List[Tuple[str, int]]:
+    """
+    Plan how many VMs go into each namespace.
+
+    Namespaces are numbered from start_index and each is given a random number of
+    VMs within VMS_PER_NAMESPACE_RANGE, until count VMs are placed or
+    MAX_NAMESPACES is reached.
+
+    Returns:
+        List of (namespace_name, vm_count)
+    """
+    plan = []
+    remaining_vms = count
+    namespace_index = start_index
+
+    while remaining_vms > 0 and namespace_index <= MAX_NAMESPACES:
+        # Determine how many VMs for this namespace
+        max_for_this_ns = min(remaining_vms, VMS_PER_NAMESPACE_RANGE[1])
+        min_for_this_ns = min(VMS_PER_NAMESPACE_RANGE[0], max_for_this_ns)
+        vms_in_namespace = random.randint(min_for_this_ns, max_for_this_ns)
+
+        plan.append((generate_namespace_name(namespace_index), vms_in_namespace))
+        remaining_vms -= vms_in_namespace
+        namespace_index += 1
+
+    return plan
+
+
+def serialize_json(obj) -> bytes:
+    """Serialize an object to compact JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+class RequestBodyEncoder:
+    """
+    Stand-in for the json module in kubernetes.client.rest, which only uses it to
+    encode request bodies.
+
+    Bodies that are already serialized to bytes are sent unchanged; the ApiClient
+    passes bytes through without walking them, so pre-serialized manifests skip
+    the client's serialization entirely.
+    """
+
+    @staticmethod
+    def dumps(obj) -> bytes:
+        if isinstance(obj, bytes):
+            return obj
+        return serialize_json(obj)
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting requests to `qps` per second.
+
+    Up to `burst` requests may be issued back to back before throttling starts,
+    mirroring the QPS/Burst settings of client-go.
+    """
+
+    def __init__(self, qps: float, burst: int):
+        self.qps = qps
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserve a request slot, returning how many seconds to wait before issuing it."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.qps)
+            self.updated = now
+            self.tokens -= 1
+            return -self.tokens / self.qps if self.tokens < 0 else 0
+
+    def acquire(self) -> None:
+        """Block until a request may be issued."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+def create_api_client(cfg: client.Configuration, limiter: Optional[RateLimiter] = None) -> client.ApiClient:
+    """Create an ApiClient whose requests are throttled by the optional rate limiter."""
+    api_client = client.ApiClient(cfg)
+
+    if limiter is not None:
+        call_api = api_client.call_api
+
+        def rate_limited_call_api(*args, **kwargs):
+            limiter.acquire()
+            return call_api(*args, **kwargs)
+
+        api_client.call_api = rate_limited_call_api
+
+    return api_client
+
+
+def load_api_clients(qps: float = DEFAULT_QPS,
+                     burst: int = DEFAULT_BURST) -> Tuple[client.CoreV1Api, client.CustomObjectsApi]:
+    """
+    Load kubeconfig and create API clients sized for parallel requests.
+
+    The urllib3 connection pool is enlarged so worker threads don't queue on the
+    client's default of 4 connections, and both APIs reuse the same keep-alive
+    connections. A qps of 0 disables client-side rate limiting.
+    Request bodies are encoded by RequestBodyEncoder.
+    """
+    try:
+        config.load_kube_config()
+    except Exception as e:
+        print(f"Error loading kubeconfig: {e}")
+        sys.exit(1)
+
+    # Encode request bodies with orjson when available, and send pre-serialized ones as-is
+    rest.json = RequestBodyEncoder
+
+    cfg = client.Configuration.get_default_copy()
+    cfg.connection_pool_maxsize = CONNECTION_POOL_MAXSIZE
+    client.Configuration.set_default(cfg)
+
+    # Both APIs share one ApiClient, and with it one connection pool and rate limiter
+    limiter = RateLimiter(qps, burst) if qps > 0 else None
+    api_client = create_api_client(cfg, limiter)
+    v1 = client.CoreV1Api(api_client)
+    custom_api = client.CustomObjectsApi(api_client)
+
+    return v1, custom_api
 
 
 def get_or_create_namespace(v1: client.CoreV1Api, namespace_name: str, dry_run: bool = False) -> Tuple[bool, str]:
     """
     Get or create a namespace with the test label.
 
+    The namespace is created straight away and only read back if it already exists,
+    so a new namespace costs a single request. A forbidden create is also followed
+    by a read, since authorization is checked before existence and users without
+    create permission may reuse namespaces prepared for them. Dry runs only read
+    the namespace.
+
     Returns:
         Tuple of (created, status_message)
         created: True if namespace was created, False if it existed
     """
+    create_error = None
+    if not dry_run:
+        namespace = client.V1Namespace(
+            metadata=client.V1ObjectMeta(
+                name=namespace_name,
+                labels={
+                    NAMESPACE_LABEL_KEY: NAMESPACE_LABEL_VALUE
+                }
+            )
+        )
+        try:
+            discard_response(v1.create_namespace(body=namespace, _preload_content=False))
+            return True, f"Created namespace: {namespace_name}"
+        except ApiException as e:
+            if e.status not in (403, 409):
+                return False, f"Error creating namespace {namespace_name}: {e.reason}"
+            create_error = e
+
     try:
-        # Try to get the namespace
+        # Namespace already exists, check if it has our label
         ns = v1.read_namespace(name=namespace_name)
-        # Check if it has our label
         labels = ns.metadata.labels or {}
         if labels.get(NAMESPACE_LABEL_KEY) == NAMESPACE_LABEL_VALUE:
             return False, f"Reusing existing namespace: {namespace_name}"
         else:
             return False, f"Namespace {namespace_name} exists but lacks label, reusing anyway"
     except ApiException as e:
-        if e.status == 404:
-            # Namespace doesn't exist, create it
-            if dry_run:
-                return True, f"[DRY RUN] Would create namespace: {namespace_name}"
-
-            namespace = client.V1Namespace(
-                metadata=client.V1ObjectMeta(
-                    name=namespace_name,
-                    labels={
-                        NAMESPACE_LABEL_KEY: NAMESPACE_LABEL_VALUE
-                    }
-                )
-            )
-            try:
-                v1.create_namespace(body=namespace)
-                return True, f"Created namespace: {namespace_name}"
-            except ApiException as create_error:
-                return False, f"Error creating namespace {namespace_name}: {create_error.reason}"
-        else:
-            return False, f"Error checking namespace {namespace_name}: {e.reason}"
+        if e.status == 404 and dry_run:
+            return True, f"[DRY RUN] Would create namespace: {namespace_name}"
+        if create_error is not None and create_error.status == 403:
+            return False, f"Error creating namespace {namespace_name}: {create_error.reason}"
+        return False, f"Error checking namespace {namespace_name}: {e.reason}"
+
+
+def find_vm_in_namespace(custom_api: client.CustomObjectsApi, namespace_name: str,
+                         label_selector: Optional[str] = None) -> Optional[Dict]:
+    """
+    Return the metadata-only item of any one VirtualMachine in a namespace matching
+    the label selector, or None if the namespace has none.
+
+    Only the metadata of at most one VM is fetched, so the check costs the same
+    regardless of how many VMs the namespace holds.
+    """
+    query_params = [("limit", 1)]
+    if label_selector:
+        query_params.append(("labelSelector", label_selector))
+
+    vms = custom_api.api_client.call_api(
+        "/apis/{group}/{version}/namespaces/{namespace}/{plural}", "GET",
+        path_params={
+            "group": VM_GROUP,
+            "version": VM_VERSION,
+            "namespace": namespace_name,
+            "plural": VM_PLURAL
+        },
+        query_params=query_params,
+        header_params={"Accept": PARTIAL_METADATA_LIST_ACCEPT},
+        response_type="object",
+        auth_settings=["BearerToken"],
+        _return_http_data_only=True
+    )
+
+    items = vms.get("items", [])
+    return items[0] if items else None
+
+
+def iter_vm_list(custom_api: client.CustomObjectsApi, namespace: Optional[str] = None,
+                 metadata_only: bool = False) -> Iterator[Dict]:
+    """
+    Yield the test VMs in one namespace, or across the cluster, a page at a time.
+
+    Pages follow the continue token, so at most LIST_PAGE_SIZE VMs are held in
+    memory. resourceVersion=0 is not sent, since the API server's watch cache
+    ignores limit for such lists and would return every VM at once. With
+    metadata_only, items carry only their metadata.
+    """
+    if namespace is None:
+        resource_path = "/apis/{group}/{version}/{plural}"
+        path_params = {"group": VM_GROUP, "version": VM_VERSION, "plural": VM_PLURAL}
+    else:
+        resource_path = "/apis/{group}/{version}/namespaces/{namespace}/{plural}"
+        path_params = {"group": VM_GROUP, "version": VM_VERSION, "namespace": namespace, "plural": VM_PLURAL}
+
+    query_params = [
+        ("labelSelector", VM_LABEL_SELECTOR),
+        ("limit", LIST_PAGE_SIZE)
+    ]
+
+    while True:
+        vms = custom_api.api_client.call_api(
+            resource_path, "GET",
+            path_params=path_params,
+            query_params=query_params,
+            header_params={"Accept": PARTIAL_METADATA_LIST_ACCEPT if metadata_only else "application/json"},
+            response_type="object",
+            auth_settings=["BearerToken"],
+            _return_http_data_only=True
+        )
+
+        yield from vms.get("items", [])
+
+        continue_token = vms.get("metadata", {}).get("continue")
+        if not continue_token:
+            break
+
+        query_params = [
+            ("labelSelector", VM_LABEL_SELECTOR),
+            ("limit", LIST_PAGE_SIZE),
+            ("continue", continue_token)
+        ]
+
+
+def iter_vms(custom_api: client.CustomObjectsApi, namespace_list: List[str],
+             metadata_only: bool = False) -> Iterator[Dict]:
+    """
+    Yield the test VMs in the given namespaces.
+
+    The VMs are listed cluster-wide in one paged list. Users without permission to
+    list VMs across the cluster get a 403 on the first page, and the namespaces
+    are then listed one by one instead.
+    """
+    namespaces = set(namespace_list)
+    yielded = False
+    try:
+        for vm in iter_vm_list(custom_api, metadata_only=metadata_only):
+            if vm["metadata"]["namespace"] in namespaces:
+                yielded = True
+                yield vm
+        return
+    except ApiException as e:
+        if e.status != 403 or yielded:
+            raise
+
+    for namespace in namespace_list:
+        yield from iter_vm_list(custom_api, namespace, metadata_only)
 
 
 def delete_namespace_if_empty(v1: client.CoreV1Api, custom_api: client.CustomObjectsApi,
@@ -135,27 +455,12 @@ def delete_namespace_if_empty(v1: client.CoreV1Api, custom_api: client.CustomObj
         if labels.get(NAMESPACE_LABEL_KEY) != NAMESPACE_LABEL_VALUE:
             return False, f"Namespace {namespace_name} doesn't have our label, skipping"
 
-        # Check for any remaining VMs with our label
-        vms = custom_api.list_namespaced_custom_object(
-            group="kubevirt.io",
-            version="v1",
-            namespace=namespace_name,
-            plural="virtualmachines",
-            label_selector=f"{VM_LABEL_KEY}={VM_LABEL_VALUE}"
-        )
-
-        if len(vms.get("items", [])) > 0:
-            return False, f"Namespace {namespace_name} still has VMs, skipping deletion"
-
-        # Check for any other VMs (not created by us)
-        all_vms = custom_api.list_namespaced_custom_object(
-            group="kubevirt.io",
-            version="v1",
-            namespace=namespace_name,
-            plural="virtualmachines"
-        )
-
-        if len(all_vms.get("items", [])) > 0:
+        # Check for any remaining VMs, ours or not, in a single request
+        vm = find_vm_in_namespace(custom_api, namespace_name)
+        if vm is not None:
+            vm_labels = vm["metadata"].get("labels") or {}
+            if vm_labels.get(VM_LABEL_KEY) == VM_LABEL_VALUE:
+                return False, f"Namespace {namespace_name} still has VMs, skipping deletion"
             return False, f"Namespace {namespace_name} has other VMs, skipping deletion"
 
         # Safe to delete
@@ -181,9 +486,12 @@ def create_vm_manifest(name: str, namespace: str, specs: Dict[str, any]) -> Dict
     - containerdisk with cirros image (lightweight)
     - sparse allocation (allocate on use, not pre-allocated)
     - randomized CPU, memory, and disk
+
+    Only the per-VM fields are built here; the static device and volume
+    definitions are shared between manifests.
     """
     manifest = {
-        "apiVersion": "kubevirt.io/v1",
+        "apiVersion": VM_API_VERSION,
         "kind": "VirtualMachine",
         "metadata": {
             "name": name,
@@ -212,30 +520,10 @@ def create_vm_manifest(name: str, namespace: str, specs: Dict[str, any]) -> Dict
                                 "memory": specs["memory"]
                             }
                         },
-                        "devices": {
-                            "disks": [
-                                {
-                                    "name": "containerdisk",
-                                    "disk": {
-                                        "bus": "virtio"
-                                    }
-                                },
-                                {
-                                    "name": "emptydisk",
-                                    "disk": {
-                                        "bus": "virtio"
-                                    }
-                                }
-                            ]
-                        }
+                        "devices": VM_DISK_DEVICES
                     },
                     "volumes": [
-                        {
-                            "name": "containerdisk",
-                            "containerDisk": {
-                                "image": "quay.io/kubevirt/cirros-container-disk-demo"
-                            }
-                        },
+                        VM_CONTAINERDISK_VOLUME,
                         {
                             "name": "emptydisk",
                             "emptyDisk": {
@@ -251,29 +539,372 @@ def create_vm_manifest(name: str, namespace: str, specs: Dict[str, any]) -> Dict
     return manifest
 
 
-def create_vms(count: int, dry_run: bool = False) -> Tuple[int, List[Dict], Dict]:
+def generate_vm_jobs(namespace_plan: List[Tuple[str, int]], start_index: int = 1):
+    """
+    Yield (vm_name, namespace_name, specs, manifest) for every VM in the plan.
+
+    VM indexes are assigned sequentially across namespaces starting at start_index.
+    """
+    vm_index = start_index
+    all_specs = iter(generate_random_specs(sum(vms for _, vms in namespace_plan)))
+    for namespace_name, vms_in_namespace in namespace_plan:
+        for specs in itertools.islice(all_specs, vms_in_namespace):
+            vm_name = generate_vm_name(vm_index)
+            manifest = create_vm_manifest(vm_name, namespace_name, specs)
+            yield vm_name, namespace_name, specs, manifest
+            vm_index += 1
+
+
+def discard_response(response) -> None:
+    """
+    Drain and release a raw urllib3 response returned with _preload_content=False.
+
+    Draining lets the connection be reused by the next request without
+    deserializing a body we don't need.
+    """
+    response.drain_conn()
+    response.release_conn()
+
+
+def create_vm(custom_api: client.CustomObjectsApi, namespace: str, manifest: Dict) -> None:
+    """
+    Create a VirtualMachine, discarding the returned object.
+
+    The manifest is serialized here so the client sends it without encoding it again.
+    """
+    discard_response(custom_api.create_namespaced_custom_object(
+        group=VM_GROUP,
+        version=VM_VERSION,
+        namespace=namespace,
+        plural=VM_PLURAL,
+        body=serialize_json(manifest),
+        _preload_content=False
+    ))
+
+
+def apply_vm(custom_api: client.CustomObjectsApi, namespace: str, manifest: Dict) -> None:
+    """
+    Create or update a VirtualMachine with server-side apply, discarding the returned object.
+
+    The generated patch_namespaced_custom_object only sends merge patches, so the
+    apply request is issued through the ApiClient directly.
+    """
+    discard_response(custom_api.api_client.call_api(
+        "/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}", "PATCH",
+        path_params={
+            "group": VM_GROUP,
+            "version": VM_VERSION,
+            "namespace": namespace,
+            "plural": VM_PLURAL,
+            "name": manifest["metadata"]["name"]
+        },
+        query_params=[("fieldManager", FIELD_MANAGER)],
+        header_params={
+            "Accept": "application/json",
+            "Content-Type": "application/apply-patch+yaml"
+        },
+        body=serialize_json(manifest),
+        auth_settings=["BearerToken"],
+        _return_http_data_only=True,
+        _preload_content=False
+    ))
+
+
+def delete_vm(custom_api: client.CustomObjectsApi, namespace: str, name: str) -> None:
+    """Delete a VirtualMachine, discarding the returned status."""
+    discard_response(custom_api.delete_namespaced_custom_object(
+        group=VM_GROUP,
+        version=VM_VERSION,
+        namespace=namespace,
+        plural=VM_PLURAL,
+        name=name,
+        _preload_content=False
+    ))
+
+
+async def discard_async_response(response) -> None:
+    """
+    Read and release a raw aiohttp response returned with _preload_content=False.
+
+    kubernetes_asyncio only raises for error statuses when it preloads the
+    response, so the status is checked here.
+    """
+    data = await response.read()
+    response.release()
+    if not 200 <= response.status <= 299:
+        raise async_rest.ApiException(http_resp=async_rest.RESTResponse(response, data))
+
+
+async def create_vm_async(custom_api, namespace: str, manifest: Dict) -> None:
+    """Create a VirtualMachine with kubernetes_asyncio, discarding the returned object."""
+    await discard_async_response(await custom_api.create_namespaced_custom_object(
+        group=VM_GROUP,
+        version=VM_VERSION,
+        namespace=namespace,
+        plural=VM_PLURAL,
+        body=serialize_json(manifest),
+        _preload_content=False
+    ))
+
+
+async def apply_vm_async(custom_api, namespace: str, manifest: Dict) -> None:
+    """Create or update a VirtualMachine with server-side apply using kubernetes_asyncio."""
+    await discard_async_response(await custom_api.patch_namespaced_custom_object(
+        group=VM_GROUP,
+        version=VM_VERSION,
+        namespace=namespace,
+        plural=VM_PLURAL,
+        name=manifest["metadata"]["name"],
+        body=serialize_json(manifest),
+        field_manager=FIELD_MANAGER,
+        _content_type="application/apply-patch+yaml",
+        _preload_content=False
+    ))
+
+
+async def delete_vm_async(custom_api, namespace: str, name: str) -> None:
+    """Delete a VirtualMachine with kubernetes_asyncio, discarding the returned status."""
+    await discard_async_response(await custom_api.delete_namespaced_custom_object(
+        group=VM_GROUP,
+        version=VM_VERSION,
+        namespace=namespace,
+        plural=VM_PLURAL,
+        name=name,
+        _preload_content=False
+    ))
+
+
+# Statuses a retried request gets when an earlier attempt already did its job
+RETRY_DONE_STATUSES = {
+    create_vm: 409,
+    create_vm_async: 409,
+    delete_vm: 404,
+    delete_vm_async: 404
+}
+
+
+def is_api_error(error: Exception) -> bool:
+    """Check whether error is an API error from either the sync or the async client."""
+    return isinstance(error, ApiException) or (async_client is not None and isinstance(error, async_rest.ApiException))
+
+
+def describe_error(error: Exception) -> str:
+    """Describe a failed request: the HTTP reason for API errors, the message otherwise."""
+    if is_api_error(error):
+        return str(error.reason)
+    return str(error)
+
+
+# Backoff jitter has its own generator so retries don't disturb --seed reproducibility
+retry_random = random.Random()
+
+
+def retry_delay(error: Exception, attempt: int) -> Optional[float]:
+    """
+    Return how long to wait before retrying a request that failed with error, or
+    None if it should not be retried.
+
+    Throttled and transiently failing requests are retried up to
+    MAX_REQUEST_ATTEMPTS times in total. The server's Retry-After header is
+    honoured when present, otherwise the wait is an exponential backoff with full
+    jitter. Either way the wait is capped at MAX_RETRY_BACKOFF. attempt counts
+    from 0.
+    """
+    if attempt + 1 >= MAX_REQUEST_ATTEMPTS:
+        return None
+    if not is_api_error(error) or error.status not in RETRY_STATUSES:
+        return None
+
+    retry_after = error.headers.get("Retry-After") if error.headers else None
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0.0), MAX_RETRY_BACKOFF)
+        except ValueError:
+            pass  # HTTP-date form, fall back to backoff
+
+    return min(2 ** attempt, MAX_RETRY_BACKOFF) * retry_random.random() + 0.05
+
+
+def may_have_persisted(error: Exception) -> bool:
+    """Check whether a failed write may still have been persisted by the API server."""
+    return is_api_error(error) and error.status in MAYBE_PERSISTED_STATUSES
+
+
+def retried_request_succeeded(function: Callable, error: Exception, maybe_persisted: bool) -> bool:
+    """
+    Check whether a retried request failed only because an earlier attempt succeeded.
+
+    A 500 or 504 may be returned after the write was already persisted, so a
+    retried create can see 409 and a retried delete 404 for its own earlier
+    attempt. maybe_persisted tells whether any earlier attempt failed that way;
+    after only 429s or 503s nothing was written, so a 409 or 404 is a real
+    failure. Server-side apply is idempotent and needs no such check.
+    """
+    return maybe_persisted and is_api_error(error) and error.status == RETRY_DONE_STATUSES.get(function)
+
+
+def call_with_retry(function: Callable, *args):
+    """Call function(*args), retrying it after the delay given by retry_delay."""
+    maybe_persisted = False
+    for attempt in itertools.count():
+        try:
+            return function(*args)
+        except Exception as e:
+            if retried_request_succeeded(function, e, maybe_persisted):
+                return None
+            maybe_persisted = maybe_persisted or may_have_persisted(e)
+            delay = retry_delay(e, attempt)
+            if delay is None:
+                raise
+            time.sleep(delay)
+
+
+def run_requests(executor: ThreadPoolExecutor, custom_api: client.CustomObjectsApi,
+                 requests: Iterator[Tuple], on_complete: Callable[[Tuple, Optional[Exception]], None]) -> None:
+    """
+    Run API requests on the thread pool.
+
+    Each request is a (key, function, args) tuple and is issued as
+    function(custom_api, *args), retried by call_with_retry. on_complete(key, error)
+    is called on this thread as each request finishes, with error None on
+    success, so callers can keep their bookkeeping without locks.
+    """
+    futures = {executor.submit(call_with_retry, function, custom_api, *args): key
+               for key, function, args in requests}
+
+    for future in as_completed(futures):
+        on_complete(futures[future], future.exception())
+
+
+def run_requests_async(requests: Iterator[Tuple], on_complete: Callable[[Tuple, Optional[Exception]], None],
+                       workers: int = DEFAULT_WORKERS, qps: float = DEFAULT_QPS,
+                       burst: int = DEFAULT_BURST) -> None:
+    """
+    Run API requests as coroutines on an asyncio event loop using kubernetes_asyncio.
+
+    Requests are (key, coroutine function, args) tuples, issued as
+    function(custom_api, *args) with at most `workers` in flight, optionally
+    throttled to `qps` requests per second. Failed requests are retried after the
+    delay given by retry_delay, keeping their slot while they wait.
+    on_complete(key, error) is called on the event loop as each request finishes,
+    with error None on success.
+    """
+    if async_client is None:
+        print("Error: kubernetes_asyncio is required for --async. Install with: pip install kubernetes_asyncio")
+        sys.exit(1)
+
+    async def run_all():
+        await async_config.load_kube_config()
+
+        # Encode request bodies with orjson when available, and send pre-serialized ones as-is
+        async_rest.json = RequestBodyEncoder
+
+        cfg = async_client.Configuration.get_default_copy()
+        cfg.connection_pool_maxsize = CONNECTION_POOL_MAXSIZE
+        limiter = RateLimiter(qps, burst) if qps > 0 else None
+        semaphore = asyncio.Semaphore(workers)
+
+        async with async_client.ApiClient(cfg) as api_client:
+            custom_api = async_client.CustomObjectsApi(api_client)
+
+            async def run(key, function, args):
+                async with semaphore:
+                    maybe_persisted = False
+                    for attempt in itertools.count():
+                        if limiter is not None:
+                            await asyncio.sleep(limiter.reserve())
+                        try:
+                            await function(custom_api, *args)
+                            error = None
+                            break
+                        except Exception as e:
+                            if retried_request_succeeded(function, e, maybe_persisted):
+                                error = None
+                                break
+                            maybe_persisted = maybe_persisted or may_have_persisted(e)
+                            delay = retry_delay(e, attempt)
+                            if delay is None:
+                                error = e
+                                break
+                            await asyncio.sleep(delay)
+                on_complete(key, error)
+
+            await asyncio.gather(*(run(key, function, args) for key, function, args in requests))
+
+    asyncio.run(run_all())
+
+
+def summarize_specs(vms: List[Dict]) -> Tuple[Tuple[int, int, float], ...]:
+    """
+    Compute the spread of CPU, memory and disk specs in a single pass over the VMs.
+
+    Returns:
+        Tuple of (min, max, avg) for CPU cores, memory GiB and disk GiB
+    """
+    first = vms[0]["specs"]
+    cpu_min = cpu_max = first["cpu"]
+    memory_min = memory_max = first["memory_gi"]
+    disk_min = disk_max = first["disk_gi"]
+    cpu_sum = memory_sum = disk_sum = 0
+
+    for vm in vms:
+        specs = vm["specs"]
+        cpu = specs["cpu"]
+        memory = specs["memory_gi"]
+        disk = specs["disk_gi"]
+
+        cpu_sum += cpu
+        memory_sum += memory
+        disk_sum += disk
+        if cpu < cpu_min:
+            cpu_min = cpu
+        elif cpu > cpu_max:
+            cpu_max = cpu
+        if memory < memory_min:
+            memory_min = memory
+        elif memory > memory_max:
+            memory_max = memory
+        if disk < disk_min:
+            disk_min = disk
+        elif disk > disk_max:
+            disk_max = disk
+
+    count = len(vms)
+    return (
+        (cpu_min, cpu_max, cpu_sum / count),
+        (memory_min, memory_max, memory_sum / count),
+        (disk_min, disk_max, disk_sum / count)
+    )
+
+
+def create_vms(count: int, dry_run: bool = False, workers: int = DEFAULT_WORKERS,
+               qps: float = DEFAULT_QPS, burst: int = DEFAULT_BURST,
+               server_side_apply: bool = False, use_async: bool = False) -> Tuple[int, List[Dict], Dict]:
     """
     Create the specified number of VirtualMachine resources distributed across namespaces.
 
+    Namespaces are prepared up front, then the VMs are created. Both steps issue requests
+    in parallel using a pool of `workers` threads, optionally throttled to `qps` requests per second.
+    With server_side_apply, VMs are applied instead of created. Since VM names carry a
+    random suffix, a rerun only applies the same VMs again when it uses the same seed.
+    With use_async, the VMs are created from an asyncio event loop with kubernetes_asyncio
+    instead of the thread pool.
+
     Returns:
         Tuple of (successful_count, list of created VM details, namespace stats)
     """
     if count < 1:
         raise ValueError(f"VM count must be at least 1")
+    if workers < 1:
+        raise ValueError(f"Worker count must be at least 1")
 
-    # Load kubeconfig
-    try:
-        config.load_kube_config()
-    except Exception as e:
-        print(f"Error loading kubeconfig: {e}")
-        sys.exit(1)
-
-    # Create API clients
-    v1 = client.CoreV1Api()
-    custom_api = client.CustomObjectsApi()
+    # Load kubeconfig and create API clients
+    v1, custom_api = load_api_clients(qps, burst)
 
     created_vms = []
-    failed_vms = []
+    failed_count = 0
+    failure_counts = Counter()  # Failed VMs per error reason
+    failure_samples = []  # The first MAX_FAILURE_SAMPLES failed VMs
     namespace_stats = {}
     created_namespaces = []
     reused_namespaces = []
@@ -282,106 +913,89 @@ def create_vms(count: int, dry_run: bool = False) -> Tuple[int, List[Dict], Dict
     print(f"\n{'=' * 80}")
     print(f"Starting VM creation: {count} VirtualMachines")
     print(f"Distribution: {VMS_PER_NAMESPACE_RANGE[0]}-{VMS_PER_NAMESPACE_RANGE[1]} VMs per namespace")
-    print(f"VM Label: {VM_LABEL_KEY}={VM_LABEL_VALUE}")
-    print(f"Namespace Label: {NAMESPACE_LABEL_KEY}={NAMESPACE_LABEL_VALUE}")
+    print(f"VM Label: {VM_LABEL_SELECTOR}")
+    print(f"Namespace Label: {NAMESPACE_LABEL_SELECTOR}")
+    print(f"Workers: {workers}")
+    print(f"Server-side apply: {server_side_apply}")
+    print(f"Async: {use_async}")
     print(f"Dry run: {dry_run}")
     print(f"{'=' * 80}\n")
 
-    # Calculate namespace distribution
-    remaining_vms = count
-    namespace_index = 1
-    vm_index = 1
-
-    # Create progress bar
-    pbar = tqdm(total=count, desc="Creating VMs", unit="VM", ncols=100)
-
-    while remaining_vms > 0 and namespace_index <= MAX_NAMESPACES:
-        # Determine how many VMs for this namespace
-        max_for_this_ns = min(remaining_vms, VMS_PER_NAMESPACE_RANGE[1])
-        min_for_this_ns = min(VMS_PER_NAMESPACE_RANGE[0], max_for_this_ns)
-        vms_in_namespace = random.randint(min_for_this_ns, max_for_this_ns)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Plan the namespace distribution and prepare each round of namespaces in parallel
+        # before any VM is created. VMs planned for a namespace that can't be used are
+        # planned again into the next ones.
+        remaining_vms = count
+        next_namespace_index = 1
+        namespace_plan = []
+
+        while remaining_vms > 0 and next_namespace_index <= MAX_NAMESPACES:
+            plan = plan_distribution(remaining_vms, next_namespace_index)
+            next_namespace_index += len(plan)
+
+            # Create or get namespaces
+            results = executor.map(
+                lambda planned: get_or_create_namespace(v1, planned[0], dry_run),
+                plan
+            )
 
-        namespace_name = generate_namespace_name(namespace_index)
+            for (namespace_name, vms_in_namespace), (ns_created, ns_message) in zip(plan, results):
+                if not dry_run:
+                    if ns_created:
+                        created_namespaces.append(namespace_name)
+                    else:
+                        reused_namespaces.append(namespace_name)
 
-        # Create or get namespace
-        ns_created, ns_message = get_or_create_namespace(v1, namespace_name, dry_run)
-        if not dry_run:
-            if ns_created:
-                created_namespaces.append(namespace_name)
+                if ns_created or "Reusing" in ns_message:
+                    namespace_stats[namespace_name] = {
+                        "created": ns_created,
+                        "vm_count": 0,
+                        "failed_count": 0
+                    }
+                    namespace_plan.append((namespace_name, vms_in_namespace))
+                    remaining_vms -= vms_in_namespace
+
+        # Create progress bar
+        pbar = tqdm(total=count, desc="Creating VMs", unit="VM", ncols=100,
+                    mininterval=PROGRESS_MININTERVAL, miniters=PROGRESS_MINITERS)
+
+        def record_vm(job: Tuple[str, str, Dict], error: Optional[Exception]) -> None:
+            """Record the outcome of one VM creation and advance the progress bar."""
+            nonlocal failed_count
+            vm_name, namespace_name, specs = job
+            if error is None:
+                created_vms.append({
+                    "name": vm_name,
+                    "namespace": namespace_name,
+                    "specs": specs,
+                    "status": "dry-run" if dry_run else "created"
+                })
+                namespace_stats[namespace_name]["vm_count"] += 1
             else:
-                reused_namespaces.append(namespace_name)
-
-        if ns_created or "Reusing" in ns_message:
-            namespace_stats[namespace_name] = {
-                "created": ns_created,
-                "vm_count": 0,
-                "failed_count": 0
-            }
-
-            # Create VMs in this namespace
-            for _ in range(vms_in_namespace):
-                if vm_index > count:
-                    break
+                failed_count += 1
+                reason = describe_error(error)
+                failure_counts[reason] += 1
+                if len(failure_samples) < MAX_FAILURE_SAMPLES:
+                    failure_samples.append((vm_name, namespace_name, reason))
+                namespace_stats[namespace_name]["failed_count"] += 1
 
-                vm_name = generate_vm_name(vm_index)
-                specs = generate_random_specs()
+            # Update progress bar
+            pbar.update(1)
+            pbar.set_postfix_str(f"Namespaces={len(namespace_stats)}, Failed={failed_count}", refresh=False)
 
-                try:
-                    manifest = create_vm_manifest(vm_name, namespace_name, specs)
-
-                    if dry_run:
-                        created_vms.append({
-                            "name": vm_name,
-                            "namespace": namespace_name,
-                            "specs": specs,
-                            "status": "dry-run"
-                        })
-                        namespace_stats[namespace_name]["vm_count"] += 1
-                    else:
-                        # Create the VM
-                        custom_api.create_namespaced_custom_object(
-                            group="kubevirt.io",
-                            version="v1",
-                            namespace=namespace_name,
-                            plural="virtualmachines",
-                            body=manifest
-                        )
-
-                        created_vms.append({
-                            "name": vm_name,
-                            "namespace": namespace_name,
-                            "specs": specs,
-                            "status": "created"
-                        })
-                        namespace_stats[namespace_name]["vm_count"] += 1
-
-                    # Update progress bar
-                    pbar.update(1)
-                    pbar.set_postfix({"Namespaces": len(namespace_stats), "Failed": len(failed_vms)})
-
-                except ApiException as e:
-                    failed_vms.append({
-                        "name": vm_name,
-                        "namespace": namespace_name,
-                        "error": str(e.reason)
-                    })
-                    namespace_stats[namespace_name]["failed_count"] += 1
-                    pbar.update(1)
-                    pbar.set_postfix({"Namespaces": len(namespace_stats), "Failed": len(failed_vms)})
-                except Exception as e:
-                    failed_vms.append({
-                        "name": vm_name,
-                        "namespace": namespace_name,
-                        "error": str(e)
-                    })
-                    namespace_stats[namespace_name]["failed_count"] += 1
-                    pbar.update(1)
-                    pbar.set_postfix({"Namespaces": len(namespace_stats), "Failed": len(failed_vms)})
-
-                vm_index += 1
-                remaining_vms -= 1
-
-        namespace_index += 1
+        if dry_run:
+            for vm_name, namespace_name, specs, manifest in generate_vm_jobs(namespace_plan):
+                record_vm((vm_name, namespace_name, specs), None)
+        elif use_async:
+            create_function = apply_vm_async if server_side_apply else create_vm_async
+            requests = (((vm_name, namespace_name, specs), create_function, (namespace_name, manifest))
+                        for vm_name, namespace_name, specs, manifest in generate_vm_jobs(namespace_plan))
+            run_requests_async(requests, record_vm, workers, qps, burst)
+        else:
+            create_function = apply_vm if server_side_apply else create_vm
+            requests = (((vm_name, namespace_name, specs), create_function, (namespace_name, manifest))
+                        for vm_name, namespace_name, specs, manifest in generate_vm_jobs(namespace_plan))
+            run_requests(executor, custom_api, requests, record_vm)
 
     # Close progress bar
     pbar.close()
@@ -395,7 +1009,7 @@ def create_vms(count: int, dry_run: bool = False) -> Tuple[int, List[Dict], Dict
     print(f"{'=' * 80}")
     print(f"Total requested: {count}")
     print(f"Successfully created: {len(created_vms)}")
-    print(f"Failed: {len(failed_vms)}")
+    print(f"Failed: {failed_count}")
     print(f"Duration: {duration:.2f} seconds")
     if len(created_vms) > 0:
         print(f"Average: {duration/len(created_vms):.2f} seconds per VM")
@@ -407,69 +1021,74 @@ def create_vms(count: int, dry_run: bool = False) -> Tuple[int, List[Dict], Dict
 
     # Statistics on randomized specs
     if created_vms:
-        cpu_counts = [vm["specs"]["cpu"] for vm in created_vms]
-        memory_sizes = [int(vm["specs"]["memory"].rstrip("Gi")) for vm in created_vms]
-        disk_sizes = [int(vm["specs"]["disk"].rstrip("Gi")) for vm in created_vms]
+        cpu_stats, memory_stats, disk_stats = summarize_specs(created_vms)
 
         print(f"\nRandomized Specifications:")
-        print(f"  CPU cores:   min={min(cpu_counts)}, max={max(cpu_counts)}, avg={sum(cpu_counts)/len(cpu_counts):.1f}")
-        print(f"  Memory (Gi): min={min(memory_sizes)}, max={max(memory_sizes)}, avg={sum(memory_sizes)/len(memory_sizes):.1f}")
-        print(f"  Disk (Gi):   min={min(disk_sizes)}, max={max(disk_sizes)}, avg={sum(disk_sizes)/len(disk_sizes):.1f}")
+        print(f"  CPU cores:   min={cpu_stats[0]}, max={cpu_stats[1]}, avg={cpu_stats[2]:.1f}")
+        print(f"  Memory (Gi): min={memory_stats[0]}, max={memory_stats[1]}, avg={memory_stats[2]:.1f}")
+        print(f"  Disk (Gi):   min={disk_stats[0]}, max={disk_stats[1]}, avg={disk_stats[2]:.1f}")
 
         # VM distribution per namespace
         vms_per_ns = [stats["vm_count"] for stats in namespace_stats.values()]
         print(f"\nVMs per Namespace:")
         print(f"  min={min(vms_per_ns)}, max={max(vms_per_ns)}, avg={sum(vms_per_ns)/len(vms_per_ns):.1f}")
 
-    if failed_vms:
+    if failure_counts:
+        print(f"\nFailures by reason:")
+        for reason, reason_count in failure_counts.most_common():
+            print(f"  {reason_count:5d}  {reason}")
+
         print(f"\nFailed VMs:")
-        for vm in failed_vms[:10]:  # Show first 10 failures
-            print(f"  - {vm['name']} in {vm['namespace']}: {vm['error']}")
-        if len(failed_vms) > 10:
-            print(f"  ... and {len(failed_vms) - 10} more")
+        for vm_name, namespace_name, reason in failure_samples:
+            print(f"  - {vm_name} in {namespace_name}: {reason}")
+        if failed_count > len(failure_samples):
+            print(f"  ... and {failed_count - len(failure_samples)} more")
 
     print(f"{'=' * 80}\n")
 
     return len(created_vms), created_vms, namespace_stats
 
 
-def delete_vms(dry_run: bool = False) -> Tuple[int, int]:
+def delete_vms(dry_run: bool = False, workers: int = DEFAULT_WORKERS,
+               qps: float = DEFAULT_QPS, burst: int = DEFAULT_BURST,
+               use_async: bool = False) -> Tuple[int, int]:
     """
     Delete all VirtualMachine resources with the test label across all namespaces.
     Then delete empty namespaces that have our label.
 
+    VM deletion requests are issued in parallel using a pool of `workers` threads,
+    optionally throttled to `qps` requests per second. With use_async, VMs are
+    deleted from an asyncio event loop with kubernetes_asyncio instead.
+
     Returns:
         Tuple of (vms_deleted, namespaces_deleted)
     """
-    # Load kubeconfig
-    try:
-        config.load_kube_config()
-    except Exception as e:
-        print(f"Error loading kubeconfig: {e}")
-        sys.exit(1)
+    if workers < 1:
+        raise ValueError(f"Worker count must be at least 1")
 
-    # Create API clients
-    v1 = client.CoreV1Api()
-    custom_api = client.CustomObjectsApi()
+    # Load kubeconfig and create API clients
+    v1, custom_api = load_api_clients(qps, burst)
 
     start_time = datetime.now()
 
     print(f"\n{'=' * 80}")
     print(f"Starting VM deletion across all namespaces")
-    print(f"VM Label selector: {VM_LABEL_KEY}={VM_LABEL_VALUE}")
-    print(f"Namespace Label: {NAMESPACE_LABEL_KEY}={NAMESPACE_LABEL_VALUE}")
+    print(f"VM Label selector: {VM_LABEL_SELECTOR}")
+    print(f"Namespace Label: {NAMESPACE_LABEL_SELECTOR}")
+    print(f"Workers: {workers}")
+    print(f"Async: {use_async}")
     print(f"Dry run: {dry_run}")
     print(f"{'=' * 80}\n")
 
     # First, find all namespaces with our label
     try:
         namespaces = v1.list_namespace(
-            label_selector=f"{NAMESPACE_LABEL_KEY}={NAMESPACE_LABEL_VALUE}"
+            label_selector=NAMESPACE_LABEL_SELECTOR
         )
         namespace_list = [ns.metadata.name for ns in namespaces.items]
 
         if not namespace_list:
-            print(f"No namespaces found with label {NAMESPACE_LABEL_KEY}={NAMESPACE_LABEL_VALUE}")
+            print(f"No namespaces found with label {NAMESPACE_LABEL_SELECTOR}")
             print("No VMs to delete.")
             return 0, 0
 
@@ -485,116 +1104,91 @@ def delete_vms(dry_run: bool = False) -> Tuple[int, int]:
         print(f"Unexpected error: {e}")
         return 0, 0
 
-    # First, count total VMs to delete
-    total_vms_to_delete = 0
-    namespace_vm_counts = {}
-
-    for namespace in namespace_list:
-        try:
-            vms = custom_api.list_namespaced_custom_object(
-                group="kubevirt.io",
-                version="v1",
-                namespace=namespace,
-                plural="virtualmachines",
-                label_selector=f"{VM_LABEL_KEY}={VM_LABEL_VALUE}"
-            )
-            vm_count = len(vms.get("items", []))
-            namespace_vm_counts[namespace] = vm_count
-            total_vms_to_delete += vm_count
-        except:
-            pass
-
-    if total_vms_to_delete == 0:
-        print("No VMs found to delete.\n")
-        return 0, 0
-
-    print(f"Found {total_vms_to_delete} VMs to delete\n")
-
     # Delete VMs from each namespace
     total_vms_deleted = 0
     total_vms_failed = 0
+    failure_counts = Counter()  # Failed VM deletions per error reason
+    namespaces_deleted = 0
+    namespaces_skipped = 0
 
-    # Create progress bar for deletion
-    pbar = tqdm(total=total_vms_to_delete, desc="Deleting VMs", unit="VM", ncols=100)
+    # VMs are listed a page at a time and deleted as they are found
+    vms = iter_vms(custom_api, namespace_list, metadata_only=True)
+    try:
+        first_vm = next(vms, None)
+    except ApiException as e:
+        print(f"Error listing VMs: {e.reason}")
+        return 0, 0
+    except Exception as e:
+        print(f"Unexpected error: {e}")
+        return 0, 0
 
-    for namespace in namespace_list:
-        try:
-            # List VMs with the label in this namespace
-            vms = custom_api.list_namespaced_custom_object(
-                group="kubevirt.io",
-                version="v1",
-                namespace=namespace,
-                plural="virtualmachines",
-                label_selector=f"{VM_LABEL_KEY}={VM_LABEL_VALUE}"
-            )
+    if first_vm is None:
+        print("No VMs found to delete.\n")
+        return 0, 0
 
-            vm_list = vms.get("items", [])
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Create progress bar for deletion, its total grows as VMs are listed
+        pbar = tqdm(total=0, desc="Deleting VMs", unit="VM", ncols=100,
+                    mininterval=PROGRESS_MININTERVAL, miniters=PROGRESS_MINITERS)
 
-            if len(vm_list) == 0:
-                continue
+        def record_deletion(namespace: str, error: Optional[Exception]) -> None:
+            """Record the outcome of one VM deletion and advance the progress bar."""
+            nonlocal total_vms_deleted, total_vms_failed
+            if error is None:
+                total_vms_deleted += 1
+            else:
+                total_vms_failed += 1
+                failure_counts[describe_error(error)] += 1
 
-            deleted_in_ns = 0
-            failed_in_ns = 0
+            # Update progress bar
+            pbar.update(1)
+            pbar.set_postfix_str(f"Namespace={namespace}, Failed={total_vms_failed}", refresh=False)
 
-            for vm in vm_list:
-                vm_name = vm["metadata"]["name"]
+        def delete_requests(delete_function: Callable) -> Iterator[Tuple]:
+            """Yield a delete request for every listed VM, growing the progress bar total."""
+            try:
+                for vm in itertools.chain([first_vm], vms):
+                    namespace = vm["metadata"]["namespace"]
+                    pbar.total += 1
 
-                try:
                     if dry_run:
-                        deleted_in_ns += 1
-                        total_vms_deleted += 1
-                    else:
-                        custom_api.delete_namespaced_custom_object(
-                            group="kubevirt.io",
-                            version="v1",
-                            namespace=namespace,
-                            plural="virtualmachines",
-                            name=vm_name
-                        )
-                        deleted_in_ns += 1
-                        total_vms_deleted += 1
-
-                    # Update progress bar
-                    pbar.update(1)
-                    pbar.set_postfix({"Namespace": namespace, "Failed": total_vms_failed})
-
-                except ApiException as e:
-                    failed_in_ns += 1
-                    total_vms_failed += 1
-                    pbar.update(1)
-                    pbar.set_postfix({"Namespace": namespace, "Failed": total_vms_failed})
-                except Exception as e:
-                    failed_in_ns += 1
-                    total_vms_failed += 1
-                    pbar.update(1)
-                    pbar.set_postfix({"Namespace": namespace, "Failed": total_vms_failed})
+                        record_deletion(namespace, None)
+                        continue
 
-        except ApiException as e:
-            print(f"Error listing VMs in {namespace}: {e.reason}")
-        except Exception as e:
-            print(f"Unexpected error with {namespace}: {e}")
+                    yield namespace, delete_function, (namespace, vm["metadata"]["name"])
+            except ApiException as e:
+                pbar.write(f"Error listing VMs: {e.reason}")
+            except Exception as e:
+                pbar.write(f"Unexpected error: {e}")
 
-    # Close progress bar
-    pbar.close()
+        if use_async and not dry_run:
+            run_requests_async(delete_requests(delete_vm_async), record_deletion, workers, qps, burst)
+        else:
+            run_requests(executor, custom_api, delete_requests(delete_vm), record_deletion)
 
-    # Now delete empty namespaces
-    print(f"\nChecking namespaces for deletion...")
-    namespaces_deleted = 0
-    namespaces_skipped = 0
+        # Close progress bar
+        pbar.close()
 
-    if not dry_run:
-        # Wait a bit for VM deletions to propagate
-        time.sleep(2)
+        # Now delete empty namespaces
+        print(f"\nChecking namespaces for deletion...")
 
-    for namespace in namespace_list:
-        deleted, message = delete_namespace_if_empty(v1, custom_api, namespace, dry_run)
-        if deleted:
-            namespaces_deleted += 1
-            print(message)
-        else:
-            namespaces_skipped += 1
-            if "still has VMs" not in message and "other VMs" not in message:
+        if not dry_run:
+            # Wait a bit for VM deletions to propagate
+            time.sleep(2)
+
+        results = executor.map(
+            lambda namespace: delete_namespace_if_empty(v1, custom_api, namespace, dry_run),
+            namespace_list
+        )
+
+        for deleted, message in results:
+            if deleted:
+                namespaces_deleted += 1
                 print(message)
+            else:
+                namespaces_skipped += 1
+                if "still has VMs" not in message and "other VMs" not in message:
+                    print(message)
 
     end_time = datetime.now()
     duration = (end_time - start_time).total_seconds()
@@ -605,6 +1199,8 @@ def delete_vms(dry_run: bool = False) -> Tuple[int, int]:
     print(f"{'=' * 80}")
     print(f"Total VMs deleted: {total_vms_deleted}")
     print(f"Failed VM deletions: {total_vms_failed}")
+    for reason, reason_count in failure_counts.most_common():
+        print(f"  {reason_count:5d}  {reason}")
     print(f"Namespaces deleted: {namespaces_deleted}")
     print(f"Namespaces retained: {namespaces_skipped}")
     print(f"Duration: {duration:.2f} seconds")
@@ -617,64 +1213,51 @@ def delete_vms(dry_run: bool = False) -> Tuple[int, int]:
 
 def list_vms() -> None:
     """List all VirtualMachine resources with the test label across all namespaces."""
-    try:
-        config.load_kube_config()
-    except Exception as e:
-        print(f"Error loading kubeconfig: {e}")
-        sys.exit(1)
-
-    v1 = client.CoreV1Api()
-    custom_api = client.CustomObjectsApi()
+    v1, custom_api = load_api_clients()
 
     print(f"\n{'=' * 80}")
-    print(f"VirtualMachines with label {VM_LABEL_KEY}={VM_LABEL_VALUE}")
+    print(f"VirtualMachines with label {VM_LABEL_SELECTOR}")
     print(f"{'=' * 80}\n")
 
     try:
         # Find all namespaces with our label
         namespaces = v1.list_namespace(
-            label_selector=f"{NAMESPACE_LABEL_KEY}={NAMESPACE_LABEL_VALUE}"
+            label_selector=NAMESPACE_LABEL_SELECTOR
         )
         namespace_list = [ns.metadata.name for ns in namespaces.items]
 
         if not namespace_list:
-            print(f"No namespaces found with label {NAMESPACE_LABEL_KEY}={NAMESPACE_LABEL_VALUE}")
+            print(f"No namespaces found with label {NAMESPACE_LABEL_SELECTOR}")
             print(f"{'=' * 80}\n")
             return
 
-        total_vms = 0
+        # Only the first 5 VMs per namespace are kept for display
+        namespace_vm_counts = {}
         namespace_details = {}
+        try:
+            for vm in iter_vms(custom_api, namespace_list):
+                namespace = vm["metadata"]["namespace"]
+                namespace_vm_counts[namespace] = namespace_vm_counts.get(namespace, 0) + 1
+                vm_list = namespace_details.setdefault(namespace, [])
+                if len(vm_list) < 5:
+                    vm_list.append(vm)
+        except ApiException as e:
+            print(f"Error listing VMs: {e.reason}")
+            print(f"{'=' * 80}\n")
+            return
 
-        for namespace in namespace_list:
-            try:
-                vms = custom_api.list_namespaced_custom_object(
-                    group="kubevirt.io",
-                    version="v1",
-                    namespace=namespace,
-                    plural="virtualmachines",
-                    label_selector=f"{VM_LABEL_KEY}={VM_LABEL_VALUE}"
-                )
-
-                vm_list = vms.get("items", [])
-                if len(vm_list) > 0:
-                    namespace_details[namespace] = vm_list
-                    total_vms += len(vm_list)
-
-            except ApiException as e:
-                print(f"Error listing VMs in {namespace}: {e.reason}")
-            except Exception as e:
-                print(f"Unexpected error with {namespace}: {e}")
+        total_vms = sum(namespace_vm_counts.values())
 
-        print(f"Total: {total_vms} VMs across {len(namespace_details)} namespaces\n")
+        print(f"Total: {total_vms} VMs across {len(namespace_vm_counts)} namespaces\n")
 
-        for namespace, vm_list in sorted(namespace_details.items()):
-            print(f"{namespace}: {len(vm_list)} VMs")
-            for vm in vm_list[:5]:  # Show first 5 per namespace
+        for namespace, vm_count in sorted(namespace_vm_counts.items()):
+            print(f"{namespace}: {vm_count} VMs")
+            for vm in namespace_details[namespace]:  # Show first 5 per namespace
                 name = vm["metadata"]["name"]
                 running = vm["spec"].get("running", False)
                 print(f"  - {name} (running: {running})")
-            if len(vm_list) > 5:
-                print(f"  ... and {len(vm_list) - 5} more")
+            if vm_count > 5:
+                print(f"  ... and {vm_count - 5} more")
             print()
 
         print(f"{'=' * 80}\n")
@@ -687,6 +1270,34 @@ def list_vms() -> None:
         print(f"{'=' * 80}\n")
 
 
+def add_api_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the concurrency and client rate limit options shared by API-heavy commands."""
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of parallel API requests (default: {DEFAULT_WORKERS})"
+    )
+    parser.add_argument(
+        "--qps",
+        type=float,
+        default=DEFAULT_QPS,
+        help="Maximum API requests per second, 0 for unlimited (default: unlimited)"
+    )
+    parser.add_argument(
+        "--burst",
+        type=int,
+        default=DEFAULT_BURST,
+        help=f"Requests allowed above --qps in a burst (default: {DEFAULT_BURST})"
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Issue VM requests from an asyncio event loop (requires kubernetes_asyncio)"
+    )
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -711,8 +1322,8 @@ Examples:
   {sys.argv[0]} delete --dry-run
 
 Note:
-- VMs are created with label {VM_LABEL_KEY}={VM_LABEL_VALUE}
-- Namespaces are created with label {NAMESPACE_LABEL_KEY}={NAMESPACE_LABEL_VALUE}
+- VMs are created with label {VM_LABEL_SELECTOR}
+- Namespaces are created with label {NAMESPACE_LABEL_SELECTOR}
 - VMs are distributed randomly (1-20 per namespace) across multiple namespaces
 - Namespaces are automatically created (qe-ns-###) and deleted when empty
         """
@@ -733,6 +1344,17 @@ Note:
         action="store_true",
         help="Simulate creation without actually creating resources"
     )
+    create_parser.add_argument(
+        "--seed",
+        type=int,
+        help="Random seed for a repeatable VM distribution, names and specs"
+    )
+    create_parser.add_argument(
+        "--server-side-apply",
+        action="store_true",
+        help=f"Apply VMs with server-side apply (field manager: {FIELD_MANAGER}) instead of creating them"
+    )
+    add_api_arguments(create_parser)
 
     # Delete command
     delete_parser = subparsers.add_parser("delete", help="Delete VirtualMachine resources and empty namespaces")
@@ -741,6 +1363,7 @@ Note:
         action="store_true",
         help="Simulate deletion without actually deleting resources"
     )
+    add_api_arguments(delete_parser)
 
     # List command
     list_parser = subparsers.add_parser("list", help="List VirtualMachine resources across all namespaces")
@@ -752,13 +1375,20 @@ Note:
         sys.exit(1)
 
     if args.command == "create":
+        if args.seed is not None:
+            random.seed(args.seed)
         try:
-            create_vms(args.count, args.dry_run)
+            create_vms(args.count, args.dry_run, args.workers, args.qps, args.burst,
+                       args.server_side_apply, args.use_async)
         except ValueError as e:
             print(f"Error: {e}")
             sys.exit(1)
     elif args.command == "delete":
-        delete_vms(args.dry_run)
+        try:
+            delete_vms(args.dry_run, args.workers, args.qps, args.burst, args.use_async)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
     elif args.command == "list":
         list_vms()
 